@@ -4,10 +4,14 @@ from abc import ABC, abstractmethod
 from dataclasses import dataclass, field
 from typing import Optional, List
 import numpy as np
+import sys
 import time
 
+# Slotted dataclasses need Python 3.10+; older interpreters keep __dict__
+_DATACLASS_SLOTS = {"slots": True} if sys.version_info >= (3, 10) else {}
 
-@dataclass
+
+@dataclass(**_DATACLASS_SLOTS)
 class RobotState:
     """Robot state"""
     position: np.ndarray = field(default_factory=lambda: np.zeros(3))
@@ -19,12 +23,12 @@ class RobotState:
     def to_dict(self) -> dict:
         return {
             "position": self.position.tolist(),
-            "battery": f"{self.battery_level}%",
-            "temperature": f"{self.temperature}°C"
+            "battery": f"{self.battery_level:.1f}%",
+            "temperature": f"{self.temperature:.1f}°C"
         }
 
 
-@dataclass  
+@dataclass(**_DATACLASS_SLOTS)
 class TaskResult:
     """Task execution result"""
     success: bool
@@ -49,6 +53,13 @@ class RobotAdapter(ABC):
     BRAND: str = ""
     ROBOT_TYPE: str = RobotType.QUADRUPED
     
+    # Read-only arrays shared by every state an adapter reports, so
+    # get_state() does not allocate new ones per call
+    _ZERO_POSITION = np.zeros(3)
+    _ZERO_POSITION.setflags(write=False)
+    _IDENTITY_ORIENTATION = np.array([0.0, 0.0, 0.0, 1.0])
+    _IDENTITY_ORIENTATION.setflags(write=False)
+    
     def __init__(self, ip: str = "192.168.12.1", **kwargs):
         self.ip = ip
         self.connected = False
@@ -66,6 +77,15 @@ class RobotAdapter(ABC):
     def get_state(self) -> RobotState:
         pass
     
+    async def aget_state(self) -> RobotState:
+        """Awaitable get_state(); runs it in the default executor so state
+        reads from remote robots do not block the event loop"""
+        # Only async callers need asyncio; keep it off the import path
+        import asyncio
+        
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(None, self.get_state)
+    
     @abstractmethod
     def move(self, x: float, y: float, yaw: float) -> TaskResult:
         """Move: x-forward, y-left, yaw-rotation"""
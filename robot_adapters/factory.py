@@ -1,26 +1,31 @@
 """Robot Factory"""
 
-from typing import Optional, Dict, Type
+from types import MappingProxyType
+from typing import Optional, Mapping, Type
 from .base import RobotAdapter
 
 
 class RobotFactory:
     """Factory for creating robot adapters"""
     
-    _registry: Dict[str, Type[RobotAdapter]] = {}
+    # Read-only view, replaced as a whole on each register() call
+    _registry: Mapping[str, Type[RobotAdapter]] = MappingProxyType({})
+    _available: str = "[]"
     
     @classmethod
     def register(cls, robot_code: str):
         def decorator(adapter_class: Type[RobotAdapter]):
-            cls._registry[robot_code] = adapter_class
+            cls._registry = MappingProxyType({**cls._registry, robot_code: adapter_class})
+            cls._available = str(list(cls._registry))
             return adapter_class
         return decorator
     
     @classmethod
     def create(cls, robot_code: str, ip: str = "192.168.12.1", **kwargs) -> Optional[RobotAdapter]:
-        if robot_code not in cls._registry:
-            raise ValueError(f"Unknown: {robot_code}. Available: {list(cls._registry.keys())}")
-        return cls._registry[robot_code](ip=ip, **kwargs)
+        adapter_class = cls._registry.get(robot_code)
+        if adapter_class is None:
+            raise ValueError(f"Unknown: {robot_code}. Available: {cls._available}")
+        return adapter_class(ip=ip, **kwargs)
     
     @classmethod
     def list_supported(cls) -> list:
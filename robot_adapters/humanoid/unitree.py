@@ -1,7 +1,6 @@
 """Unitree Humanoid Robots (G1, H1)"""
 
-import numpy as np
-from typing import Optional, List
+from typing import List
 
 from ..base import RobotAdapter, RobotState, TaskResult, RobotType
 
@@ -22,7 +21,12 @@ class UnitreeG1Adapter(RobotAdapter):
         self.connected = False
     
     def get_state(self) -> RobotState:
-        return RobotState(battery_level=90.0, temperature=32.0)
+        return RobotState(
+            position=self._ZERO_POSITION,
+            orientation=self._IDENTITY_ORIENTATION,
+            battery_level=90.0,
+            temperature=32.0
+        )
     
     def move(self, x: float, y: float, yaw: float) -> TaskResult:
         return TaskResult(True, f"Move: x={x}, y={y}")
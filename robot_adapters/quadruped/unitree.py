@@ -1,7 +1,7 @@
 """Unitree Quadruped Robots (GO1, GO2)"""
 
 import numpy as np
-from typing import Optional, List
+from typing import List
 
 from ..base import RobotAdapter, RobotState, TaskResult, RobotType
 
@@ -14,6 +14,12 @@ class UnitreeGO2Adapter(RobotAdapter):
     BRAND = "Unitree"
     ROBOT_TYPE = RobotType.QUADRUPED
     
+    _STAND_POSITION = np.array([0.0, 0.0, 0.4])
+    _STAND_POSITION.setflags(write=False)
+    
+    # Built-in actions: name -> display name
+    _ACTIONS = {"wave": "Wave", "handshake": "Handshake", "dance": "Dance"}
+    
     def __init__(self, ip: str = "192.168.12.1", **kwargs):
         super().__init__(ip, **kwargs)
         
@@ -26,7 +32,8 @@ class UnitreeGO2Adapter(RobotAdapter):
     
     def get_state(self) -> RobotState:
         return RobotState(
-            position=np.array([0.0, 0.0, 0.4]),
+            position=self._STAND_POSITION,
+            orientation=self._IDENTITY_ORIENTATION,
             battery_level=85.0,
             temperature=35.0
         )
@@ -47,9 +54,9 @@ class UnitreeGO2Adapter(RobotAdapter):
         return TaskResult(True, f"Go to {position}")
     
     def play_action(self, action_name: str) -> TaskResult:
-        actions = {"wave": "Wave", "handshake": "Handshake", "dance": "Dance"}
-        if action_name in actions:
-            return TaskResult(True, f"Action: {actions[action_name]}")
+        display_name = self._ACTIONS.get(action_name)
+        if display_name:
+            return TaskResult(True, f"Action: {display_name}")
         return TaskResult(False, f"Unknown: {action_name}")
 
 
@@ -6,7 +6,7 @@ import numpy as np
 import time
 from dataclasses import dataclass
 
-from ..base import SensorAdapter, SensorData
+from ..base import SensorAdapter
 
 
 @dataclass
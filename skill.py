@@ -4,28 +4,92 @@ Control robots via OpenClaw with natural language commands from IM.
 """
 
 import re
-from typing import Optional, Tuple
-from robot_adapters import RobotFactory, RobotAdapter
-from sensor_adapters import Insight9Adapter
-from slam import VisualSLAM, Navigator
+import threading
+from typing import TYPE_CHECKING, Optional, Tuple
+from robot_adapters import RobotFactory, RobotAdapter, TaskResult
+
+if TYPE_CHECKING:
+    from slam import VisualSLAM, Navigator
+
+
+# (keywords, number pattern, action, parameter name), tried in order
+_COMMAND_SPECS = [
+    (("forward", "向前", "前进"), r"\s*(\d+(?:\.\d+)?)?\s*m?", "forward", "distance"),
+    (("backward", "向后", "后退"), r"\s*(\d+(?:\.\d+)?)?\s*m?", "backward", "distance"),
+    (("turn.?left", "左转"), r"\s*(\d+)?\s*度?", "turn_left", "angle"),
+    (("turn.?right", "右转"), r"\s*(\d+)?\s*度?", "turn_right", "angle"),
+    (("stand", "站立", "站起"), "", "stand", None),
+    (("sit", "坐下"), "", "sit", None),
+    (("stop", "停止"), "", "stop", None),
+    (("wave", "挥手"), "", "wave", None),
+    (("handshake", "握手"), "", "handshake", None),
+]
+
+# (pattern, action, parameter name), compiled once at import
+_COMMAND_PATTERNS = tuple(
+    (re.compile("(%s)%s" % ("|".join(keywords), suffix), re.IGNORECASE), action, param_name)
+    for keywords, suffix, action, param_name in _COMMAND_SPECS
+)
+
+# Bare keywords of parameterless commands; matched exactly so they skip
+# the pattern scan in _parse_command
+_SIMPLE_COMMANDS = {
+    keyword: action
+    for keywords, _, action, param_name in _COMMAND_SPECS
+    if not param_name
+    for keyword in keywords
+}
+
+# Values used when a parameterised command omits its number
+_DEFAULT_PARAMS = {"distance": 1.0, "angle": 45}
+
+# Direction sign per straight-line move action, applied to the distance
+_MOVE_SIGNS = {"forward": 1, "backward": -1}
+
+# Signed yaw rate per turn action; turns last abs(angle) / 45 seconds
+_TURN_YAW_RATES = {"turn_left": 0.5, "turn_right": -0.5}
+
+# Actions that send their own move/stop, replacing a running turn's motion
+_MOTION_ACTIONS = frozenset({"forward", "backward", "turn_left", "turn_right", "stop"})
 
 
 class RoboticsSkill:
     """OpenClaw skill for robot control"""
     
+    __slots__ = ("robot", "slam", "navigator", "_stop_timer")
+    
     def __init__(self):
         self.robot: Optional[RobotAdapter] = None
-        self.slam: Optional[VisualSLAM] = None
-        self.navigator: Optional[Navigator] = None
+        self.slam: Optional["VisualSLAM"] = None
+        self.navigator: Optional["Navigator"] = None
+        # Stop scheduled by a running turn, cancelled by the next command
+        self._stop_timer: Optional[threading.Timer] = None
         
     def initialize(self, robot: str = "unitree_go2", 
                    robot_ip: str = "192.168.12.1", config: dict = None) -> dict:
         """Initialize robot connection"""
         # Create robot
-        self.robot = RobotFactory.create(robot, robot_ip)
-        if not self.robot or not self.robot.connect():
+        adapter = RobotFactory.create(robot, robot_ip)
+        
+        if not adapter:
+            return {"success": False, "error": "Failed to connect robot"}
+        try:
+            connected = adapter.connect()
+        except OSError as e:
+            adapter.disconnect()
+            return {"success": False, "error": f"Failed to connect robot: {e}"}
+        if not connected:
+            adapter.disconnect()
             return {"success": False, "error": "Failed to connect robot"}
         
+        # Release the previous robot only once the new one is connected
+        self._cancel_pending_stop()
+        if self.robot:
+            self.robot.stop()
+            self.robot.disconnect()
+        
+        self.robot = adapter
+        
         return {
             "success": True,
             "robot": self.robot.ROBOT_NAME,
@@ -41,81 +105,34 @@ class RoboticsSkill:
         if parsed["action"] == "unknown":
             return {"success": False, "error": f"Unknown command: {command}"}
         
+        # Other actions do not override the turn's velocity, so stop it first
+        self._cancel_pending_stop(send_stop=parsed["action"] not in _MOTION_ACTIONS)
         return self._execute_action(parsed["action"], parsed["params"])
     
     def _parse_command(self, command: str) -> dict:
         """Parse command to action"""
-        patterns = [
-            (r"(forward|向前|前进)\s*(\d+(?:\.\d+)?)?\s*m?", "forward", "distance"),
-            (r"(backward|向后|后退)\s*(\d+(?:\.\d+)?)?\s*m?", "backward", "distance"),
-            (r"(turn.?left|左转)\s*(\d+)?\s*度?", "turn_left", "angle"),
-            (r"(turn.?right|右转)\s*(\d+)?\s*度?", "turn_right", "angle"),
-            (r"(stand|站立|站起)", "stand", None),
-            (r"(sit|坐下)", "sit", None),
-            (r"(stop|停止)", "stop", None),
-            (r"(wave|挥手)", "wave", None),
-            (r"(handshake|握手)", "handshake", None),
-        ]
+        action = _SIMPLE_COMMANDS.get(command.strip().lower())
+        if action:
+            return {"action": action, "params": {}}
         
-        for pattern, action, param_name in patterns:
-            match = re.search(pattern, command, re.IGNORECASE)
+        for pattern, action, param_name in _COMMAND_PATTERNS:
+            match = pattern.search(command)
             if match:
                 params = {}
-                if param_name and len(match.groups()) > 1 and match.group(2):
-                    try:
-                        params[param_name] = float(match.group(2))
-                    except:
-                        params[param_name] = 1.0 if param_name == "distance" else 45
-                elif param_name:
-                    params[param_name] = 1.0 if param_name == "distance" else 45
+                if param_name:
+                    # Every parameterised pattern captures its number in group 2
+                    value = match.group(2)
+                    params[param_name] = float(value) if value else _DEFAULT_PARAMS[param_name]
                 return {"action": action, "params": params}
         
         return {"action": "unknown", "params": {}}
     
     def _execute_action(self, action: str, params: dict) -> dict:
         """Execute action on robot"""
+        handler = self._ACTION_HANDLERS.get(action)
         try:
-            from robot_adapters.base import TaskResult
-            
-            result = None
-            
-            if action == "forward":
-                d = params.get("distance", 1.0)
-                result = self.robot.move(d, 0, 0)
-                
-            elif action == "backward":
-                d = params.get("distance", 1.0)
-                result = self.robot.move(-d, 0, 0)
-                
-            elif action == "turn_left":
-                a = params.get("angle", 45)
-                self.robot.move(0, 0, 0.5)
-                import time
-                time.sleep(abs(a) / 45)
-                result = self.robot.stop()
-                
-            elif action == "turn_right":
-                a = abs(params.get("angle", 45))
-                self.robot.move(0, 0, -0.5)
-                import time
-                time.sleep(a / 45)
-                result = self.robot.stop()
-                
-            elif action == "stand":
-                result = self.robot.stand()
-                
-            elif action == "sit":
-                result = self.robot.sit()
-                
-            elif action == "stop":
-                result = self.robot.stop()
-                
-            elif action == "wave":
-                result = self.robot.play_action("wave")
-                
-            elif action == "handshake":
-                result = self.robot.play_action("handshake")
-                
+            if handler:
+                result = handler(self, action, params)
             else:
                 result = TaskResult(False, f"Not implemented: {action}")
             
@@ -128,8 +145,55 @@ class RoboticsSkill:
         except Exception as e:
             return {"success": False, "error": str(e)}
     
+    def _move(self, action: str, params: dict) -> TaskResult:
+        return self.robot.move(_MOVE_SIGNS[action] * params.get("distance", 1.0), 0, 0)
+    
+    def _turn(self, action: str, params: dict) -> TaskResult:
+        a = abs(params.get("angle", 45))
+        return self._start_turn(_TURN_YAW_RATES[action], a / 45)
+    
+    def _play_action(self, action: str, params: dict) -> TaskResult:
+        return self.robot.play_action(action)
+    
+    # Action -> handler(self, action, params), built once for all commands
+    _ACTION_HANDLERS = {
+        "forward": _move,
+        "backward": _move,
+        "turn_left": _turn,
+        "turn_right": _turn,
+        "stand": lambda self, action, params: self.robot.stand(),
+        "sit": lambda self, action, params: self.robot.sit(),
+        "stop": lambda self, action, params: self.robot.stop(),
+        "wave": _play_action,
+        "handshake": _play_action,
+    }
+    
+    def _start_turn(self, yaw_rate: float, duration: float) -> TaskResult:
+        """Start turning and schedule the stop instead of blocking on it"""
+        result = self.robot.move(0, 0, yaw_rate)
+        if result.success:
+            self._stop_timer = threading.Timer(duration, self.robot.stop)
+            self._stop_timer.start()
+        return result
+    
+    def _cancel_pending_stop(self, send_stop: bool = False) -> None:
+        """Drop a scheduled stop so it cannot interrupt a newer command;
+        with send_stop, stop the robot now instead of leaving it turning"""
+        if self._stop_timer:
+            # A timer that already fired has stopped the robot itself
+            turning = self._stop_timer.is_alive()
+            self._stop_timer.cancel()
+            self._stop_timer = None
+            if send_stop and turning:
+                self.robot.stop()
+    
     def start_slam(self, sensor: str = "insight9") -> dict:
         """Start SLAM with Insight9"""
+        # Sensor and SLAM stacks are only needed here; keep them off the
+        # import path for plain robot control.
+        from sensor_adapters import Insight9Adapter
+        from slam import VisualSLAM, Navigator
+        
         sensor_adapter = Insight9Adapter()
         if sensor_adapter.connect():
             self.slam = VisualSLAM(sensor_adapter)
@@ -1,7 +1,6 @@
 """Visual SLAM Module"""
 
 import numpy as np
-from typing import Optional, Tuple, List
 from dataclasses import dataclass
 
 
@@ -0,0 +1,7 @@
+"""Shared test setup"""
+
+import os
+import sys
+
+# The skill and its packages live at the repository root
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
@@ -0,0 +1,16 @@
+"""Tests for the robot adapter base class"""
+
+import asyncio
+
+from robot_adapters import RobotFactory
+
+
+def test_aget_state_returns_adapter_state():
+    adapter = RobotFactory.create("unitree_go2")
+    
+    state = asyncio.run(adapter.aget_state())
+    expected = adapter.get_state()
+    
+    assert state.position.tolist() == expected.position.tolist()
+    assert state.battery_level == expected.battery_level
+    assert state.temperature == expected.temperature
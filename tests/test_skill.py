@@ -0,0 +1,109 @@
+"""Tests for RoboticsSkill command execution"""
+
+import pytest
+
+from robot_adapters import RobotAdapter, RobotFactory, RobotState, TaskResult
+from skill import RoboticsSkill
+
+
+class RecordingAdapter(RobotAdapter):
+    """Adapter that records the calls it receives"""
+    
+    ROBOT_CODE = "recording"
+    ROBOT_NAME = "Recording Robot"
+    
+    def __init__(self, ip: str = "127.0.0.1", **kwargs):
+        super().__init__(ip, **kwargs)
+        self.calls = []
+    
+    def connect(self) -> bool:
+        self.connected = True
+        return True
+    
+    def disconnect(self) -> None:
+        self.calls.append("disconnect")
+        self.connected = False
+    
+    def get_state(self) -> RobotState:
+        return RobotState()
+    
+    def move(self, x: float, y: float, yaw: float) -> TaskResult:
+        self.calls.append("move")
+        return TaskResult(True)
+    
+    def stop(self) -> TaskResult:
+        self.calls.append("stop")
+        return TaskResult(True)
+    
+    def play_action(self, action_name: str) -> TaskResult:
+        self.calls.append(action_name)
+        return TaskResult(True)
+
+
+class RefusingAdapter(RecordingAdapter):
+    """Adapter whose robot does not accept the connection"""
+    
+    def connect(self) -> bool:
+        return False
+
+
+class UnreachableAdapter(RecordingAdapter):
+    """Adapter whose robot cannot be reached"""
+    
+    def connect(self) -> bool:
+        raise OSError("host unreachable")
+
+
+@pytest.fixture
+def skill():
+    skill = RoboticsSkill()
+    skill.robot = RecordingAdapter()
+    yield skill
+    skill._cancel_pending_stop()
+
+
+def test_turn_then_wave_stops_before_waving(skill):
+    skill.execute("turn left 90")
+    skill.execute("wave")
+    
+    assert skill.robot.calls == ["move", "stop", "wave"]
+    assert skill._stop_timer is None
+
+
+def test_wave_after_finished_turn_sends_no_extra_stop(skill):
+    skill.execute("turn left 1")
+    skill._stop_timer.join()
+    skill.execute("wave")
+    
+    assert skill.robot.calls == ["move", "stop", "wave"]
+
+
+def test_turn_then_forward_replaces_turn_without_stop(skill):
+    skill.execute("turn left 90")
+    skill.execute("forward 1")
+    
+    assert skill.robot.calls == ["move", "move"]
+    assert skill._stop_timer is None
+
+
+def test_initialize_stops_turning_robot_before_disconnect(skill):
+    old_robot = skill.robot
+    skill.execute("turn right 90")
+    
+    assert skill.initialize("unitree_go2")["success"]
+    assert old_robot.calls == ["move", "stop", "disconnect"]
+
+
+@pytest.mark.parametrize("adapter_class, error", [
+    (RefusingAdapter, "Failed to connect robot"),
+    (UnreachableAdapter, "Failed to connect robot: host unreachable"),
+])
+def test_initialize_failure_keeps_current_robot(skill, monkeypatch, adapter_class, error):
+    old_robot = skill.robot
+    new_robot = adapter_class()
+    monkeypatch.setattr(RobotFactory, "create", staticmethod(lambda robot, ip: new_robot))
+    
+    assert skill.initialize("unitree_go2") == {"success": False, "error": error}
+    assert skill.robot is old_robot
+    assert old_robot.calls == []
+    assert new_robot.calls == ["disconnect"]